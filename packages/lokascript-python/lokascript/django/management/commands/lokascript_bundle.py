@@ -5,6 +5,7 @@ Usage:
     python manage.py hyperfixi_bundle
     python manage.py hyperfixi_bundle --output bundle-config.json
     python manage.py hyperfixi_bundle --format summary
+    python manage.py hyperfixi_bundle --cache .hyperfixi-scan.json
 """
 
 from __future__ import annotations
@@ -103,6 +104,11 @@ class Command(BaseCommand):
             type=str,
             help="Comma-separated list of languages to always include",
         )
+        parser.add_argument(
+            "--cache",
+            type=str,
+            help="Cache file for scan results; unchanged templates are not re-scanned",
+        )
         parser.add_argument(
             "--verbose",
             "-v",
@@ -132,14 +138,14 @@ class Command(BaseCommand):
             self.stdout.write(f"Scanning directories: {template_dirs}\n")
 
         # Create scanner and aggregator
-        scanner = Scanner(debug=verbose > 1)
+        cache_path = Path(options["cache"]) if options["cache"] else None
+        scanner = Scanner(cache_path=cache_path, debug=verbose > 1)
         aggregator = Aggregator()
 
         # Scan all directories
-        for dir_path in template_dirs:
-            usage_map = scanner.scan_directory(dir_path)
-            for file_path, usage in usage_map.items():
-                aggregator.add(file_path, usage)
+        usage_map = scanner.scan_directories(template_dirs)
+        for file_path, usage in usage_map.items():
+            aggregator.add(file_path, usage)
 
         if not aggregator.has_usage():
             self.stdout.write(self.style.WARNING("No hyperscript usage detected\n"))
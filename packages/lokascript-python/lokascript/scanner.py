@@ -16,16 +16,33 @@ Example:
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import heapq
+import json
+import os
 import re
+import string
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
+
+# Use google-re2 for template extraction when installed. This is worst-case
+# protection, not a speedup: re2 is several times slower than `re` on typical
+# templates, but matches in linear time, so an unterminated {% hs %} block in
+# a large template can't make the lazy block-tag pattern backtrack badly.
+# Snippet analysis stays on `re`, which needs Unicode \w and \b.
+try:
+    import re2 as _re_backend
+except ImportError:
+    _re_backend = re
 
 if TYPE_CHECKING:
-    from typing import Iterable
+    from typing import Iterable, Iterator
 
 
-@dataclass
+@dataclass(slots=True)
 class FileUsage:
     """Usage information detected from a single file."""
 
@@ -40,11 +57,16 @@ class FileUsage:
 
     def merge(self, other: FileUsage) -> None:
         """Merge another FileUsage into this one."""
-        self.commands.update(other.commands)
-        self.blocks.update(other.blocks)
+        # Most snippets only contribute a command or two, so skip the
+        # set.update() calls for empty fields
+        if other.commands:
+            self.commands.update(other.commands)
+        if other.blocks:
+            self.blocks.update(other.blocks)
         if other.positional:
             self.positional = True
-        self.detected_languages.update(other.detected_languages)
+        if other.detected_languages:
+            self.detected_languages.update(other.detected_languages)
 
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
@@ -55,8 +77,18 @@ class FileUsage:
             "detected_languages": sorted(self.detected_languages),
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> FileUsage:
+        """Create a FileUsage from the output of to_dict()."""
+        return cls(
+            commands=set(data.get("commands", ())),
+            blocks=set(data.get("blocks", ())),
+            positional=bool(data.get("positional", False)),
+            detected_languages=set(data.get("detected_languages", ())),
+        )
 
-@dataclass
+
+@dataclass(slots=True)
 class AggregatedUsage:
     """Aggregated usage information across all files."""
 
@@ -78,62 +110,58 @@ class AggregatedUsage:
 
 
 # Hyperscript extraction patterns
-# From _="..." attributes and Django template tags
-HYPERSCRIPT_PATTERNS = [
+# From _="..." attributes and Django template tags. Each alternative captures
+# its snippet in a uniquely named group so that every format is extracted in a
+# single finditer() pass.
+_HYPERSCRIPT_SOURCES = (
     # Standard attributes
-    re.compile(r'_="([^"]*)"'),  # _="..."
-    re.compile(r"_='([^']*)'"),  # _='...'
-    re.compile(r"_=`([^`]*)`"),  # _=`...` (backticks)
+    r'_="(?P<attr_dq>[^"]*)"',  # _="..."
+    r"_='(?P<attr_sq>[^']*)'",  # _='...'
+    r"_=`(?P<attr_bt>[^`]*)`",  # _=`...` (backticks)
     # JSX patterns (Vue, Svelte, React)
-    re.compile(r"_=\{`([^`]+)`\}"),  # _={`...`} (JSX template literal)
-    re.compile(r"_=\{['\"]([^'\"]+)['\"]\}"),  # _={"..."} or _={'...'} (JSX)
+    r"_=\{`(?P<jsx_bt>[^`]+)`\}",  # _={`...`} (JSX template literal)
+    r"_=\{['\"](?P<jsx_quoted>[^'\"]+)['\"]\}",  # _={"..."} or _={'...'} (JSX)
     # data-hs variant
-    re.compile(r'data-hs="([^"]*)"'),  # data-hs="..."
-    re.compile(r"data-hs='([^']*)'"),  # data-hs='...'
+    r'data-hs="(?P<data_hs_dq>[^"]*)"',  # data-hs="..."
+    r"data-hs='(?P<data_hs_sq>[^']*)'",  # data-hs='...'
     # Django block tag
-    re.compile(r"\{%\s*hs\s*%\}(.*?)\{%\s*endhs\s*%\}", re.DOTALL),
+    r"\{%\s*hs\s*%\}(?P<hs_block>.*?)\{%\s*endhs\s*%\}",
     # Django simple tags
-    re.compile(r'\{%\s*hs_attr\s+"([^"]+)"\s*%\}'),  # {% hs_attr "..." %}
-    re.compile(r"\{%\s*hs_attr\s+'([^']+)'\s*%\}"),  # {% hs_attr '...' %}
-    re.compile(r'\{%\s*hs_script\s+"([^"]+)"\s*%\}'),  # {% hs_script "..." %}
-    re.compile(r"\{%\s*hs_script\s+'([^']+)'\s*%\}"),  # {% hs_script '...' %}
-    # Script tags
-    re.compile(
-        r'<script[^>]*type=["\']?text/hyperscript["\']?[^>]*>(.*?)</script>',
-        re.DOTALL | re.IGNORECASE,
-    ),
-]
-
-# Command detection pattern (21 commands from vite-plugin scanner.ts)
-# These are the commands that can be tree-shaken in bundle generation
-COMMAND_PATTERN = re.compile(
-    r"\b(toggle|add|remove|removeClass|show|hide|set|get|put|append|"
-    r"take|increment|decrement|log|send|trigger|wait|transition|go|call|"
-    r"focus|blur|return)\b",
-    re.IGNORECASE,
-)
-
-# Block detection patterns
-# Each block has specific syntax requirements
-BLOCK_PATTERNS: dict[str, re.Pattern[str]] = {
-    "if": re.compile(r"\bif\b", re.IGNORECASE),
-    "unless": re.compile(r"\bunless\b", re.IGNORECASE),  # maps to 'if' block
-    "repeat": re.compile(
-        r"\brepeat\s+(\d+|:\w+|\$\w+|[\w.]+)\s+times?\b", re.IGNORECASE
-    ),
-    "for": re.compile(r"\bfor\s+(each|every)\b", re.IGNORECASE),
-    "while": re.compile(r"\bwhile\b", re.IGNORECASE),
-    "fetch": re.compile(r"\bfetch\b", re.IGNORECASE),
-    "async": re.compile(r"\basync\b", re.IGNORECASE),
-}
-
-# Positional expression pattern
-# These expressions require the positional expression module
-POSITIONAL_PATTERN = re.compile(
-    r"\b(first|last|next|previous|closest|parent)\b", re.IGNORECASE
+    r'\{%\s*hs_attr\s+"(?P<hs_attr_dq>[^"]+)"\s*%\}',  # {% hs_attr "..." %}
+    r"\{%\s*hs_attr\s+'(?P<hs_attr_sq>[^']+)'\s*%\}",  # {% hs_attr '...' %}
+    r'\{%\s*hs_script\s+"(?P<hs_script_dq>[^"]+)"\s*%\}',  # {% hs_script "..." %}
+    r"\{%\s*hs_script\s+'(?P<hs_script_sq>[^']+)'\s*%\}",  # {% hs_script '...' %}
 )
+# DOTALL is set globally with a leading (?s), which re2.compile also accepts.
+# Only hs_block contains a ".", and a scoped (?s:...) group would disable
+# sre's first-character prefix scan for the whole alternation.
+HYPERSCRIPT_PATTERN = _re_backend.compile("(?s)" + "|".join(_HYPERSCRIPT_SOURCES))
+
+# <script type="text/hyperscript"> bodies are extracted with str.find by
+# _extract_hs_script_tags rather than a lazy DOTALL regex
+_HS_SCRIPT_TYPE = "text/hyperscript"
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+# Minimum number of files before scan_directory_parallel uses a process pool
+PARALLEL_MIN_FILES = 64
+
+# Every snippet found by extract_hyperscript other than script tags contains
+# one of these literal substrings or starts with a {% hs... tag. They are
+# checked before any full regex pass so that files without hyperscript are
+# rejected at memchr speed; only when they all miss is the content lowercased
+# to look for the (case-insensitive) script MIME type. A bare "{%" is no use
+# as a needle, since nearly every Django template contains one.
+_FAST_NEEDLES = ("_=", "data-hs")
+_HS_TAG_PREFIX = re.compile(r"\{%\s*hs")
+_FAST_NEEDLES_BYTES = tuple(needle.encode("ascii") for needle in _FAST_NEEDLES)
+# Bytes \s lacks the \x1c-\x1f separators str \s matches, and non-ASCII bytes
+# may encode Unicode whitespace, so both are let through here
+_HS_TAG_PREFIX_BYTES = re.compile(rb"\{%[\s\x1c-\x1f\x80-\xff]*hs")
+_HS_SCRIPT_TYPE_BYTES = _HS_SCRIPT_TYPE.encode("ascii")
 
 # Valid commands for validation (lowercase)
+# These are the 21 commands from vite-plugin scanner.ts that can be
+# tree-shaken in bundle generation
 VALID_COMMANDS = {
     "toggle",
     "add",
@@ -163,6 +191,76 @@ VALID_COMMANDS = {
 # Valid blocks for validation
 VALID_BLOCKS = {"if", "repeat", "for", "while", "fetch", "async"}
 
+# Word-level lookup tables used by Scanner.analyze_script. Snippets are
+# lowercased once and split into \w+ tokens (the same boundaries \b uses);
+# the set of distinct words is then intersected with these tables instead of
+# running one regex per keyword.
+_POSITIONAL_KEYWORDS = {"first", "last", "next", "previous", "closest", "parent"}
+_BLOCK_KEYWORDS = {
+    "if": "if",
+    "unless": "if",  # 'unless' uses the same implementation as 'if'
+    "while": "while",
+    "fetch": "fetch",
+    "async": "async",
+}
+# Blocks that need more than a keyword. Group 1 (the repeat count and
+# each/every) is part of the public BLOCK_PATTERNS API.
+_REPEAT_SOURCE = r"\brepeat\s+(\d+|:\w+|\$\w+|[\w.]+)\s+times?\b"
+_FOR_SOURCE = r"\bfor\s+(each|every)\b"
+
+
+def _keyword_pattern(keywords: Iterable[str]) -> re.Pattern[str]:
+    """Compile a case-insensitive whole-word alternation with one group."""
+    # Longest first, so alternatives that share a prefix are tried greedily
+    alternation = "|".join(sorted(keywords, key=lambda word: (-len(word), word)))
+    return re.compile(rf"\b({alternation})\b", re.IGNORECASE)
+
+
+# Public single-pattern equivalents of the lookup tables, kept for callers
+# that match snippets directly; Scanner.analyze_script uses the tables.
+COMMAND_PATTERN = _keyword_pattern(VALID_COMMANDS)
+BLOCK_PATTERNS: dict[str, re.Pattern[str]] = {
+    **{word: _keyword_pattern([word]) for word in _BLOCK_KEYWORDS},
+    "repeat": re.compile(_REPEAT_SOURCE, re.IGNORECASE),
+    "for": re.compile(_FOR_SOURCE, re.IGNORECASE),
+}
+POSITIONAL_PATTERN = _keyword_pattern(_POSITIONAL_KEYWORDS)
+
+
+class _KeywordTables(NamedTuple):
+    """Analysis tables for lowercased str or ASCII-bytes snippets."""
+
+    word: re.Pattern  # \w+ tokenizer
+    commands: dict  # word -> command name
+    positional: frozenset  # positional expression words
+    blocks: dict  # word -> block name
+    repeat: re.Pattern
+    for_each: re.Pattern
+
+
+# The repeat/for patterns run on the lowercased snippet, so no IGNORECASE
+_UNICODE_TABLES = _KeywordTables(
+    word=re.compile(r"\w+"),
+    commands={command: command for command in VALID_COMMANDS},
+    positional=frozenset(_POSITIONAL_KEYWORDS),
+    blocks=dict(_BLOCK_KEYWORDS),
+    repeat=re.compile(_REPEAT_SOURCE),
+    for_each=re.compile(_FOR_SOURCE),
+)
+# Almost every snippet is ASCII. Bytes patterns skip the str machinery, so
+# those snippets are analyzed as bytes against pre-encoded tables. Bytes \s
+# lacks the \x1c-\x1f separators that str \s matches, so they are spelled out.
+_ASCII_TABLES = _KeywordTables(
+    word=re.compile(rb"\w+"),
+    commands={command.encode("ascii"): command for command in VALID_COMMANDS},
+    positional=frozenset(word.encode("ascii") for word in _POSITIONAL_KEYWORDS),
+    blocks={word.encode("ascii"): block for word, block in _BLOCK_KEYWORDS.items()},
+    repeat=re.compile(
+        rb"\brepeat[\s\x1c-\x1f]+(?:\d+|:\w+|\$\w+|[\w.]+)[\s\x1c-\x1f]+times?\b"
+    ),
+    for_each=re.compile(rb"\bfor[\s\x1c-\x1f]+(?:each|every)\b"),
+)
+
 # Supported languages for multilingual detection (synced with vite-plugin)
 SUPPORTED_LANGUAGES = [
     "en", "es", "pt", "fr", "de", "it", "vi",  # Western (Latin script)
@@ -376,6 +474,67 @@ LANGUAGE_KEYWORDS: dict[str, set[str]] = {
     },
 }
 
+# Non-Latin scripts don't need word boundary matching
+# Includes: CJK (ja, ko, zh), Arabic (ar), Cyrillic (ru, uk),
+# Indic (hi, bn), Thai (th)
+_NON_LATIN_LANGUAGES = frozenset({"ja", "ko", "zh", "ar", "ru", "uk", "hi", "bn", "th"})
+
+# LANGUAGE_KEYWORDS frozen into a tuple of (lang, substrings, pattern) rows at
+# import time, so detect_languages() doesn't rebuild patterns on every call.
+# Non-Latin languages match any keyword as a plain substring; Latin-script
+# languages use one word-bounded alternation over their lowercased keywords.
+_LANGUAGE_MATCHERS: tuple[
+    tuple[str, tuple[str, ...], re.Pattern[str] | None], ...
+] = tuple(
+    (lang, tuple(keywords), None)
+    if lang in _NON_LATIN_LANGUAGES
+    else (
+        lang,
+        (),
+        re.compile(
+            r"\b(?:"
+            + "|".join(
+                re.escape(keyword.lower())
+                for keyword in sorted(keywords)
+                # Skip very short keywords (too many false positives)
+                if len(keyword) > 2
+            )
+            + r")\b"
+        ),
+    )
+    for lang, keywords in LANGUAGE_KEYWORDS.items()
+)
+
+# Bump when the detection code or the cache layout changes. Keyword and
+# pattern changes are picked up by _cache_version() automatically.
+_CACHE_FORMAT = 1
+
+
+def _cache_version() -> str:
+    """
+    Fingerprint everything detection depends on.
+
+    Scanner(cache_path=...) files written with a different fingerprint are
+    ignored, so results cached before an upgrade that changes the keyword
+    tables (e.g. after re-syncing with vite-plugin) are not reused.
+    """
+    tables = (
+        _CACHE_FORMAT,
+        _HYPERSCRIPT_SOURCES,
+        _HS_SCRIPT_TYPE,
+        sorted(VALID_COMMANDS),
+        sorted(_BLOCK_KEYWORDS.items()),
+        sorted(_POSITIONAL_KEYWORDS),
+        _REPEAT_SOURCE,
+        _FOR_SOURCE,
+        sorted(_NON_LATIN_LANGUAGES),
+        sorted((lang, sorted(keywords)) for lang, keywords in LANGUAGE_KEYWORDS.items()),
+    )
+    return hashlib.sha256(repr(tables).encode("utf-8")).hexdigest()
+
+
+_CACHE_VERSION = _cache_version()
+
 # Regional bundle mappings
 REGIONS = {
     "western": ["en", "es", "pt", "fr", "de", "it"],
@@ -404,27 +563,14 @@ def detect_languages(script: str) -> set[str]:
     detected: set[str] = set()
     script_lower = script.lower()
 
-    # Non-Latin scripts don't need word boundary matching
-    # Includes: CJK (ja, ko, zh), Arabic (ar), Cyrillic (ru, uk),
-    # Indic (hi, bn), Thai (th)
-    non_latin_langs = {"ja", "ko", "zh", "ar", "ru", "uk", "hi", "bn", "th"}
-
-    for lang, keywords in LANGUAGE_KEYWORDS.items():
-        if lang in non_latin_langs:
+    for lang, keywords, pattern in _LANGUAGE_MATCHERS:
+        if pattern is None:
             # Non-Latin scripts - simple includes check
-            for keyword in keywords:
-                if keyword in script:
-                    detected.add(lang)
-                    break
-        else:
-            # Latin-script languages - check for word boundaries
-            for keyword in keywords:
-                if len(keyword) <= 2:
-                    continue  # Skip very short keywords (too many false positives)
-                pattern = re.compile(rf"\b{re.escape(keyword.lower())}\b")
-                if pattern.search(script_lower):
-                    detected.add(lang)
-                    break
+            if any(keyword in script for keyword in keywords):
+                detected.add(lang)
+        elif pattern.search(script_lower):
+            # Latin-script languages - word boundary match
+            detected.add(lang)
 
     return detected
 
@@ -471,6 +617,107 @@ def get_optimal_region(languages: set[str]) -> str | None:
     return "all"
 
 
+def _extract_hs_script_tags(
+    content: str, lowered: str | None = None
+) -> Iterator[tuple[int, str]]:
+    """
+    Yield (offset, body) for every <script type="text/hyperscript"> tag.
+
+    Finds each occurrence of the MIME type with str.find, checks that it is
+    the type attribute of an opening <script> tag, then finds the end of the
+    tag and the closing </script>. Tag names, attribute names and the MIME
+    type are matched case-insensitively. Pass content.lower() as lowered if
+    it has already been built.
+    """
+    # Search a lowercased copy and slice bodies from the original content, so
+    # both must have the same offsets. Only "İ" lowercases to two characters;
+    # the ASCII-only translate is a last resort, being ~20x slower than lower().
+    if lowered is None:
+        lowered = content.lower()
+    if len(lowered) != len(content):
+        lowered = content.replace("\u0130", "I").lower()
+        if len(lowered) != len(content):
+            lowered = content.translate(_ASCII_LOWER)
+    pos = 0
+    while (hit := lowered.find(_HS_SCRIPT_TYPE, pos)) != -1:
+        pos = hit + len(_HS_SCRIPT_TYPE)
+
+        # Must be the value of a type= attribute (optionally quoted)...
+        attr_end = hit - 1 if hit and lowered[hit - 1] in "\"'" else hit
+        if lowered[max(attr_end - 5, 0) : attr_end] != "type=":
+            continue
+
+        # ...inside an opening <script ...> tag
+        tag_start = lowered.rfind(">", 0, attr_end) + 1
+        if "<script" not in lowered[tag_start:attr_end]:
+            continue
+
+        body_start = lowered.find(">", pos) + 1
+        if not body_start:
+            return
+
+        body_end = lowered.find("</script>", body_start)
+        if body_end == -1:
+            return
+
+        yield body_start, content[body_start:body_end]
+        pos = body_end + 9
+
+
+@functools.lru_cache(maxsize=4096)
+def _analyze_script(
+    script: str,
+) -> tuple[frozenset[str], frozenset[str], bool, frozenset[str]]:
+    """
+    Analyze a hyperscript snippet, memoized by its source text.
+
+    The same snippet (e.g. "on click toggle .open") tends to repeat across
+    templates, so results are cached. They are returned as immutable
+    snapshots; Scanner.analyze_script copies them into a fresh FileUsage.
+
+    Returns:
+        Tuple of (commands, blocks, positional, detected_languages)
+    """
+    # Detect commands, blocks, and positional expressions from the distinct
+    # words of the lowercased snippet
+    script_lower = script.lower()
+    if script_lower.isascii():
+        text: str | bytes = script_lower.encode("ascii")
+        tables = _ASCII_TABLES
+    else:
+        text = script_lower
+        tables = _UNICODE_TABLES
+
+    words = set(tables.word.findall(text))
+    commands = {tables.commands[word] for word in words & tables.commands.keys()}
+    blocks = {tables.blocks[word] for word in words & tables.blocks.keys()}
+    positional = not tables.positional.isdisjoint(words)
+    if tables.repeat.search(text):
+        blocks.add("repeat")
+    if tables.for_each.search(text):
+        blocks.add("for")
+
+    # Detect non-English languages
+    languages = detect_languages(script)
+
+    return frozenset(commands), frozenset(blocks), positional, frozenset(languages)
+
+
+# The Scanner each worker process reuses, set up by _init_scan_worker
+_worker_scanner: Scanner | None = None
+
+
+def _init_scan_worker(scanner_type: type[Scanner], debug: bool) -> None:
+    """Create the worker process's scanner, of the caller's Scanner class."""
+    global _worker_scanner
+    _worker_scanner = scanner_type(debug=debug)
+
+
+def _scan_file_worker(path: str) -> tuple[str, dict]:
+    """Scan one file in a worker process, returning picklable results."""
+    return path, _worker_scanner.scan_file(Path(path)).to_dict()
+
+
 class Scanner:
     """
     Scanner class for detecting hyperscript usage in files.
@@ -491,6 +738,7 @@ class Scanner:
         *,
         include_extensions: set[str] | None = None,
         exclude_patterns: list[str] | None = None,
+        cache_path: Path | None = None,
         debug: bool = False,
     ) -> None:
         """
@@ -499,16 +747,21 @@ class Scanner:
         Args:
             include_extensions: File extensions to scan (default: .html, .htm, .txt, .xml)
             exclude_patterns: Directory/file patterns to exclude
+            cache_path: JSON file for persisting scan results between runs.
+                Files whose mtime and size are unchanged are not re-scanned.
             debug: Enable debug logging
         """
-        self.include_extensions = include_extensions or {
-            ".html",
-            ".htm",
-            ".txt",
-            ".xml",
-            ".jinja",
-            ".jinja2",
-        }
+        self.include_extensions = frozenset(
+            include_extensions
+            or {
+                ".html",
+                ".htm",
+                ".txt",
+                ".xml",
+                ".jinja",
+                ".jinja2",
+            }
+        )
         self.exclude_patterns = exclude_patterns or [
             "__pycache__",
             ".git",
@@ -517,19 +770,35 @@ class Scanner:
             "venv",
             "site-packages",
         ]
+        # All exclude patterns folded into one regex, so each path is checked
+        # with a single search instead of one substring test per pattern.
+        # Built lazily by _is_excluded from a snapshot of exclude_patterns.
+        self._exclude_snapshot: tuple[str, ...] | None = None
+        self._exclude_re: re.Pattern[str] | None = None
+        self.cache_path = cache_path
         self.debug = debug
+        self._cache: dict[str, dict] = self._load_cache()
+        self._cache_dirty = False
 
     def should_scan(self, path: Path) -> bool:
         """Check if a file should be scanned."""
         if path.suffix.lower() not in self.include_extensions:
             return False
 
-        path_str = str(path)
-        for pattern in self.exclude_patterns:
-            if pattern in path_str:
-                return False
+        return not self._is_excluded(str(path))
 
-        return True
+    def _is_excluded(self, path_str: str) -> bool:
+        """Check if a path or directory name contains an exclude pattern."""
+        # exclude_patterns is a public list; recompile whenever it changes
+        patterns = tuple(self.exclude_patterns)
+        if patterns != self._exclude_snapshot:
+            self._exclude_snapshot = patterns
+            self._exclude_re = (
+                re.compile("|".join(map(re.escape, patterns))) if patterns else None
+            )
+        if self._exclude_re is None:
+            return False
+        return self._exclude_re.search(path_str) is not None
 
     def extract_hyperscript(self, content: str) -> list[str]:
         """
@@ -543,15 +812,35 @@ class Scanner:
         Returns:
             List of hyperscript code snippets found
         """
-        scripts: list[str] = []
+        return list(self.iter_hyperscript(content))
+
+    def iter_hyperscript(
+        self, content: str, *, lowered: str | None = None
+    ) -> Iterator[str]:
+        """
+        Lazily yield hyperscript snippets from content, in document order.
 
-        for pattern in HYPERSCRIPT_PATTERNS:
-            for match in pattern.finditer(content):
-                script = match.group(1).strip()
-                if script:
-                    scripts.append(script)
+        Like extract_hyperscript, but without building the intermediate list,
+        so scan_content can analyze each snippet as soon as it is found.
 
-        return scripts
+        Args:
+            content: The file content to scan
+            lowered: content.lower(), if the caller has already built it
+
+        Yields:
+            Hyperscript code snippets found
+        """
+        # Merge attribute/tag matches with script tag bodies by offset so
+        # snippets come out in document order
+        matches = (
+            (match.start(), match.group(match.lastgroup))
+            for match in HYPERSCRIPT_PATTERN.finditer(content)
+        )
+        script_tags = _extract_hs_script_tags(content, lowered)
+        for _, script in heapq.merge(matches, script_tags):
+            script = script.strip()
+            if script:
+                yield script
 
     def analyze_script(self, script: str) -> FileUsage:
         """
@@ -563,29 +852,13 @@ class Scanner:
         Returns:
             FileUsage with detected commands, blocks, positional flag, and languages
         """
-        usage = FileUsage()
-
-        # Detect commands
-        for match in COMMAND_PATTERN.finditer(script):
-            usage.commands.add(match.group(1).lower())
-
-        # Detect blocks
-        for block_name, pattern in BLOCK_PATTERNS.items():
-            if pattern.search(script):
-                # 'unless' uses the same implementation as 'if'
-                if block_name == "unless":
-                    usage.blocks.add("if")
-                else:
-                    usage.blocks.add(block_name)
-
-        # Detect positional expressions
-        if POSITIONAL_PATTERN.search(script):
-            usage.positional = True
-
-        # Detect non-English languages
-        usage.detected_languages = detect_languages(script)
-
-        return usage
+        commands, blocks, positional, languages = _analyze_script(script)
+        return FileUsage(
+            commands=set(commands),
+            blocks=set(blocks),
+            positional=positional,
+            detected_languages=set(languages),
+        )
 
     def scan_content(self, content: str, file_path: str = "<string>") -> FileUsage:
         """
@@ -600,10 +873,25 @@ class Scanner:
         """
         usage = FileUsage()
 
-        scripts = self.extract_hyperscript(content)
-        for script in scripts:
-            script_usage = self.analyze_script(script)
-            usage.merge(script_usage)
+        lowered = None
+        if not (
+            any(needle in content for needle in _FAST_NEEDLES)
+            or _HS_TAG_PREFIX.search(content)
+        ):
+            # Only script tags are left; the lowered copy is reused to extract them
+            lowered = content.lower()
+            if _HS_SCRIPT_TYPE not in lowered:
+                return usage
+
+        # Bind hot-loop methods to locals
+        analyze = self.analyze_script
+        merge = usage.merge
+        # Identical snippets (e.g. a list of buttons) only need analyzing once
+        seen: set[str] = set()
+        for script in self.iter_hyperscript(content, lowered=lowered):
+            if script not in seen:
+                seen.add(script)
+                merge(analyze(script))
 
         if self.debug and usage:
             print(
@@ -625,14 +913,35 @@ class Scanner:
         Returns:
             FileUsage with detected usage
         """
+        path_str = str(path)
+        # Stat before reading, so a file modified mid-scan is re-scanned next run
+        key = self._cache_key(path_str)
+        cached = self._get_cached(path_str, key)
+        if cached is not None:
+            return cached
+
         try:
-            content = path.read_text(encoding="utf-8")
-            return self.scan_content(content, str(path))
+            # Check the raw bytes first so files without hyperscript are never
+            # decoded into a str.
+            raw = path.read_bytes()
+            if not (
+                any(needle in raw for needle in _FAST_NEEDLES_BYTES)
+                or _HS_TAG_PREFIX_BYTES.search(raw)
+                or _HS_SCRIPT_TYPE_BYTES in raw.lower()
+            ):
+                usage = FileUsage()
+            else:
+                content = raw.decode("utf-8", errors="replace")
+                usage = self.scan_content(content, path_str)
         except Exception as e:
             if self.debug:
                 print(f"[hyperfixi] Error reading {path}: {e}")
             return FileUsage()
 
+        if key is not None:
+            self._set_cached(path_str, key, usage.to_dict())
+        return usage
+
     def scan_directory(self, directory: Path) -> dict[str, FileUsage]:
         """
         Scan all template files in a directory.
@@ -643,19 +952,94 @@ class Scanner:
         Returns:
             Dict mapping file paths to their usage
         """
+        results = self._scan_directory(directory)
+        self.save_cache()
+        return results
+
+    def _scan_directory(self, directory: Path) -> dict[str, FileUsage]:
+        """Scan a directory serially without saving the cache."""
         results: dict[str, FileUsage] = {}
+        scanned: set[str] = set()
+
+        for path in self._iter_scannable_files(directory):
+            path_str = str(path)
+            scanned.add(path_str)
+            usage = self.scan_file(path)
+            if usage:
+                results[path_str] = usage
 
-        if not directory.exists():
+        self._prune_cache(directory, scanned)
+        return results
+
+    def scan_directory_parallel(
+        self, directory: Path, workers: int | None = None
+    ) -> dict[str, FileUsage]:
+        """
+        Scan all template files in a directory using a process pool.
+
+        Falls back to a serial scan when there are too few files for the
+        process start-up and IPC overhead to pay off. Each worker process
+        scans with its own instance of type(self), created with only the
+        debug argument, so Scanner subclasses must be importable at module
+        level and constructible that way.
+
+        Args:
+            directory: Directory to scan
+            workers: Maximum number of worker processes (default: CPU count)
+
+        Returns:
+            Dict mapping file paths to their usage
+        """
+        results: dict[str, FileUsage] = {}
+
+        paths = [str(path) for path in self._iter_scannable_files(directory)]
+        self._prune_cache(directory, set(paths))
+        if len(paths) < PARALLEL_MIN_FILES:
+            for path in paths:
+                usage = self.scan_file(Path(path))
+                if usage:
+                    results[path] = usage
+            self.save_cache()
             return results
 
-        for path in directory.rglob("*"):
-            if path.is_file() and self.should_scan(path):
-                usage = self.scan_file(path)
+        # Serve unchanged files from the cache; only the rest go to the pool
+        pending: dict[str, tuple[int, int] | None] = {}
+        for path in paths:
+            key = self._cache_key(path)
+            cached = self._get_cached(path, key)
+            if cached is None:
+                pending[path] = key
+            elif cached:
+                results[path] = cached
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_scan_worker,
+            initargs=(type(self), self.debug),
+        ) as executor:
+            for path, data in executor.map(_scan_file_worker, pending, chunksize=32):
+                key = pending[path]
+                if key is not None:
+                    self._set_cached(path, key, data)
+                usage = FileUsage.from_dict(data)
                 if usage:
-                    results[str(path)] = usage
+                    results[path] = usage
 
+        self.save_cache()
         return results
 
+    def _iter_scannable_files(self, directory: Path) -> Iterator[Path]:
+        """Yield every file under directory that should be scanned."""
+        for root, dirnames, filenames in os.walk(directory):
+            # Prune excluded directories in place so os.walk never descends
+            # into them. Patterns match as substrings, as in should_scan, so
+            # every file below a pruned directory would be excluded anyway.
+            dirnames[:] = [name for name in dirnames if not self._is_excluded(name)]
+            for filename in filenames:
+                path = Path(root, filename)
+                if self.should_scan(path):
+                    yield path
+
     def scan_directories(self, directories: Iterable[Path]) -> dict[str, FileUsage]:
         """
         Scan multiple directories for hyperscript usage.
@@ -669,7 +1053,108 @@ class Scanner:
         results: dict[str, FileUsage] = {}
 
         for directory in directories:
-            dir_results = self.scan_directory(directory)
+            dir_results = self._scan_directory(directory)
             results.update(dir_results)
 
+        self.save_cache()
         return results
+
+    def save_cache(self) -> None:
+        """Write the scan cache to cache_path if anything changed."""
+        if self.cache_path is None or not self._cache_dirty:
+            return
+
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self.cache_path.write_text(
+                json.dumps({"version": _CACHE_VERSION, "files": self._cache}),
+                encoding="utf-8",
+            )
+            self._cache_dirty = False
+        except OSError as e:
+            if self.debug:
+                print(f"[hyperfixi] Error writing cache {self.cache_path}: {e}")
+
+    def _load_cache(self) -> dict[str, dict]:
+        """Load the scan cache, discarding it if unreadable or outdated."""
+        if self.cache_path is None or not self.cache_path.exists():
+            return {}
+
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            if self.debug:
+                print(f"[hyperfixi] Ignoring unreadable cache {self.cache_path}: {e}")
+            return {}
+
+        if not isinstance(data, dict) or data.get("version") != _CACHE_VERSION:
+            return {}
+        files = data.get("files")
+        if not isinstance(files, dict):
+            return {}
+        # Drop malformed entries so they are simply re-scanned
+        return {
+            path: entry
+            for path, entry in files.items()
+            if self._is_valid_cache_entry(entry)
+        }
+
+    @staticmethod
+    def _is_valid_cache_entry(entry: object) -> bool:
+        """Check that a loaded cache entry has the shape _set_cached writes."""
+        if not isinstance(entry, dict):
+            return False
+        usage = entry.get("usage")
+        return (
+            type(entry.get("mtime_ns")) is int
+            and type(entry.get("size")) is int
+            and isinstance(usage, dict)
+            and isinstance(usage.get("positional", False), bool)
+            and all(
+                isinstance(values := usage.get(name, []), list)
+                and all(isinstance(value, str) for value in values)
+                for name in ("commands", "blocks", "detected_languages")
+            )
+        )
+
+    def _cache_key(self, path: str) -> tuple[int, int] | None:
+        """Return (mtime_ns, size) for path, or None if caching is off."""
+        if self.cache_path is None:
+            return None
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _get_cached(self, path: str, key: tuple[int, int] | None) -> FileUsage | None:
+        """Return the cached usage for path if its key is unchanged."""
+        if key is None:
+            return None
+        entry = self._cache.get(path)
+        if entry is None or (entry.get("mtime_ns"), entry.get("size")) != key:
+            return None
+        return FileUsage.from_dict(entry["usage"])
+
+    def _prune_cache(self, directory: Path, scanned: set[str]) -> None:
+        """
+        Drop cache entries under directory for files a scan didn't visit.
+
+        These files were deleted, renamed or are no longer matched. Entries
+        outside directory are kept, so scanning several directories one at a
+        time doesn't evict each other's results.
+        """
+        stale = [
+            path
+            for path in self._cache
+            if path not in scanned and Path(path).is_relative_to(directory)
+        ]
+        for path in stale:
+            del self._cache[path]
+        if stale:
+            self._cache_dirty = True
+
+    def _set_cached(self, path: str, key: tuple[int, int], usage: dict) -> None:
+        """Record the to_dict() usage for path under key."""
+        self._cache[path] = {"mtime_ns": key[0], "size": key[1], "usage": usage}
+        self._cache_dirty = True
@@ -11,6 +11,7 @@ import os
 from io import StringIO
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from unittest.mock import patch
 
 import pytest
 
@@ -20,6 +21,8 @@ django = pytest.importorskip("django")
 from django.core.management import call_command
 from django.test import TestCase, override_settings
 
+from lokascript.scanner import Scanner
+
 # Configure Django settings before importing command
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.settings")
 django.setup()
@@ -308,3 +311,29 @@ class TestHyperfixiBundleCommand(TestCase):
 
         assert "_meta" in config
         assert config["_meta"]["file_count"] == 2
+
+    def test_cache_option_reuses_results(self):
+        """Test that a second run with --cache is served from the cache."""
+        cache_path = self.template_dir / ".cache" / "scan.json"
+
+        def run() -> dict:
+            out = StringIO()
+            call_command(
+                "lokascript_bundle",
+                str(self.template_dir),
+                format="json",
+                cache=str(cache_path),
+                stdout=out,
+            )
+            output = out.getvalue()
+            return json.loads(output[output.find("{") : output.rfind("}") + 1])
+
+        first = run()
+        assert cache_path.exists()
+
+        with patch.object(Scanner, "scan_content") as scan_content:
+            second = run()
+
+        scan_content.assert_not_called()
+        assert second["commands"] == first["commands"]
+        assert second["_meta"]["file_count"] == 2
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import json
+import os
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
 import pytest
 
+from lokascript import scanner as scanner_module
 from lokascript.scanner import (
     Scanner,
     FileUsage,
@@ -14,6 +17,7 @@ from lokascript.scanner import (
     COMMAND_PATTERN,
     BLOCK_PATTERNS,
     POSITIONAL_PATTERN,
+    PARALLEL_MIN_FILES,
     detect_languages,
     get_optimal_region,
     SUPPORTED_LANGUAGES,
@@ -81,6 +85,18 @@ class TestFileUsage:
         assert result["blocks"] == ["if", "repeat"]
         assert result["positional"] is True
 
+    def test_from_dict_round_trip(self):
+        """from_dict should rebuild a FileUsage from to_dict output."""
+        usage = FileUsage(
+            commands={"toggle"}, blocks={"if"}, positional=True, detected_languages={"ja"}
+        )
+        assert FileUsage.from_dict(usage.to_dict()) == usage
+
+    def test_uses_slots(self):
+        """FileUsage instances should not carry a per-instance __dict__."""
+        assert not hasattr(FileUsage(), "__dict__")
+        assert not hasattr(AggregatedUsage(), "__dict__")
+
 
 class TestAggregatedUsage:
     """Tests for the AggregatedUsage dataclass."""
@@ -141,6 +157,20 @@ class TestScanner:
         assert not scanner.should_scan(Path("build/test.html"))
         assert scanner.should_scan(Path("templates/test.html"))
 
+    def test_exclude_patterns_changes_take_effect(self):
+        """Mutating or reassigning exclude_patterns should take effect immediately."""
+        scanner = Scanner(exclude_patterns=["build"])
+        assert scanner.should_scan(Path("dist/test.html"))
+        scanner.exclude_patterns.append("dist")
+        assert not scanner.should_scan(Path("dist/test.html"))
+        scanner.exclude_patterns = scanner.exclude_patterns + ["templates"]
+        assert not scanner.should_scan(Path("templates/test.html"))
+        scanner.exclude_patterns = ["templates"]
+        assert scanner.should_scan(Path("build/test.html"))
+        assert not scanner.should_scan(Path("templates/test.html"))
+        scanner.exclude_patterns = []
+        assert scanner.should_scan(Path("templates/test.html"))
+
 
 class TestExtractHyperscript:
     """Tests for hyperscript extraction."""
@@ -220,6 +250,42 @@ class TestExtractHyperscript:
         scripts = scanner.extract_hyperscript(content)
         assert scripts == ['on load log "ready"']
 
+    def test_extract_script_tags_skips_other_scripts(self):
+        """Only text/hyperscript script bodies should be extracted."""
+        scanner = Scanner()
+        content = """
+            <script src="app.js"></script>
+            <script>const type = "text/hyperscript";</script>
+            <script type='text/hyperscript' id="a">def f() log 1 end</script>
+            <Script defer type=text/hyperscript>behavior B end</SCRIPT>
+        """
+        scripts = scanner.extract_hyperscript(content)
+        assert scripts == ["def f() log 1 end", "behavior B end"]
+
+    def test_extract_script_tags_mime_type_case_insensitive(self):
+        """The MIME type should match regardless of case."""
+        scanner = Scanner()
+        content = """
+            <p>Ünïcödé İ</p>
+            <script type="TEXT/HYPERSCRIPT">def f() log 1 end</script>
+            <script type="Text/HyperScript">behavior B end</script>
+        """
+        scripts = scanner.extract_hyperscript(content)
+        assert scripts == ["def f() log 1 end", "behavior B end"]
+
+    @pytest.mark.parametrize(
+        "text", ["© 2024 — Ünïcödé", "İstanbul İzmir", "\u212a"]  # Kelvin sign -> "k"
+    )
+    def test_extract_script_tags_non_ascii_offsets(self, text: str):
+        """Script bodies should be sliced at the right offsets in non-ASCII templates."""
+        scanner = Scanner()
+        content = (
+            f"<p>{text}</p><script type='text/hyperscript'>on load log {text}</script>"
+            f"<p>{text}</p><SCRIPT TYPE='TEXT/HYPERSCRIPT'>def f() log 1 end</SCRIPT>"
+        )
+        scripts = scanner.extract_hyperscript(content)
+        assert scripts == [f"on load log {text}", "def f() log 1 end"]
+
     def test_extract_multiple(self):
         """Extract multiple hyperscript snippets."""
         scanner = Scanner()
@@ -230,6 +296,32 @@ class TestExtractHyperscript:
         scripts = scanner.extract_hyperscript(content)
         assert len(scripts) == 2
 
+    def test_extract_mixed_formats_in_document_order(self):
+        """Extract every format from one template, in document order."""
+        scanner = Scanner()
+        content = """
+            <div data-hs="on load add .ready"></div>
+            <SCRIPT type="text/hyperscript">on load log "hi"</SCRIPT>
+            <button _='on click hide me'>A</button>
+            {% hs %}
+                on click show #menu
+            {% endhs %}
+        """
+        scripts = scanner.extract_hyperscript(content)
+        assert scripts == [
+            "on load add .ready",
+            'on load log "hi"',
+            "on click hide me",
+            "on click show #menu",
+        ]
+
+    def test_iter_hyperscript_is_lazy(self):
+        """iter_hyperscript should yield snippets one at a time."""
+        scanner = Scanner()
+        snippets = scanner.iter_hyperscript('<a _="on click hide me"></a><b _="log 1"></b>')
+        assert next(snippets) == "on click hide me"
+        assert list(snippets) == ["log 1"]
+
     def test_extract_empty_returns_empty(self):
         """Extract from content without hyperscript."""
         scanner = Scanner()
@@ -359,6 +451,51 @@ class TestAnalyzeScript:
         assert usage.blocks == {"if"}
         assert usage.positional is True
 
+    def test_analyze_repeat_count_still_scanned(self):
+        """Words inside 'repeat N times' should still be detected."""
+        scanner = Scanner()
+        usage = scanner.analyze_script("repeat last times log it end")
+        assert usage.blocks == {"repeat"}
+        assert usage.commands == {"log"}
+        assert usage.positional is True
+
+    def test_analyze_respects_word_boundaries(self):
+        """Keywords embedded in longer identifiers should not be detected."""
+        scanner = Scanner()
+        usage = scanner.analyze_script("set :toggle_count to :lastIf then call setup()")
+        assert usage.commands == {"set", "call"}
+        assert usage.blocks == set()
+        assert usage.positional is False
+
+    def test_analyze_is_case_insensitive(self):
+        """Commands and blocks should be detected regardless of case."""
+        scanner = Scanner()
+        usage = scanner.analyze_script("on click IF me has .a RemoveClass .b end")
+        assert usage.commands == {"removeclass"}
+        assert usage.blocks == {"if"}
+
+    def test_analyze_uppercase_multiword_blocks(self):
+        """repeat/for suffixes should also match regardless of case."""
+        scanner = Scanner()
+        usage = scanner.analyze_script("REPEAT 3 TIMES log it end For Each x in .y end")
+        assert usage.blocks == {"repeat", "for"}
+
+    def test_analyze_non_ascii_snippet(self):
+        """Non-ASCII snippets should get the same keyword detection."""
+        scanner = Scanner()
+        usage = scanner.analyze_script("on click トグル then toggle .é if x repeat 2 times end")
+        assert usage.commands == {"toggle"}
+        assert usage.blocks == {"if", "repeat"}
+        assert "ja" in usage.detected_languages
+
+    def test_analyze_repeated_snippet_returns_independent_usage(self):
+        """Cached analysis must not leak mutations between calls."""
+        scanner = Scanner()
+        first = scanner.analyze_script("on click toggle .open")
+        first.commands.add("hide")
+        second = scanner.analyze_script("on click toggle .open")
+        assert second.commands == {"toggle"}
+
 
 class TestScanContent:
     """Tests for scanning content."""
@@ -373,12 +510,46 @@ class TestScanContent:
         usage = scanner.scan_content(content)
         assert usage.commands == {"toggle", "add", "remove"}
 
+    def test_scan_content_analyzes_duplicate_snippets_once(self, monkeypatch):
+        """Repeated snippets in one file should be analyzed only once."""
+        scanner = Scanner()
+        calls: list[str] = []
+        original = scanner.analyze_script
+        monkeypatch.setattr(
+            scanner, "analyze_script", lambda script: calls.append(script) or original(script)
+        )
+        content = '<li _="on click toggle .active">x</li>' * 50 + '<b _="on click hide me">y</b>'
+        usage = scanner.scan_content(content)
+        assert usage.commands == {"toggle", "hide"}
+        assert calls == ["on click toggle .active", "on click hide me"]
+
     def test_scan_content_empty(self):
         """scan_content on empty content returns falsy usage."""
         scanner = Scanner()
         usage = scanner.scan_content("<div>No hyperscript here</div>")
         assert not usage
 
+    def test_scan_content_skips_plain_django_template(self, monkeypatch):
+        """Django tags other than {% hs... %} should not defeat the pre-filter."""
+        scanner = Scanner()
+        monkeypatch.setattr(scanner, "iter_hyperscript", None)
+        content = '{% extends "base.html" %}{% block content %}{% if x %}y{% endif %}'
+        assert not scanner.scan_content(content)
+
+    def test_scan_content_compact_block_tag(self):
+        """The fast pre-filter must not reject {%hs%} without spaces."""
+        scanner = Scanner()
+        usage = scanner.scan_content("<b {%hs%}on click toggle .a{%endhs%}>B</b>")
+        assert usage.commands == {"toggle"}
+
+    def test_scan_content_upper_case_script_type(self):
+        """The fast pre-filter must not reject an upper-case MIME type."""
+        scanner = Scanner()
+        usage = scanner.scan_content(
+            '<script type="TEXT/HYPERSCRIPT">on click toggle .a</script>'
+        )
+        assert usage.commands == {"toggle"}
+
 
 class TestScanFile:
     """Tests for scanning files."""
@@ -392,6 +563,38 @@ class TestScanFile:
             usage = scanner.scan_file(template)
             assert usage.commands == {"toggle"}
 
+    def test_scan_file_invalid_utf8(self):
+        """scan_file should still detect usage around undecodable bytes."""
+        scanner = Scanner()
+        with TemporaryDirectory() as tmpdir:
+            template = Path(tmpdir) / "test.html"
+            template.write_bytes(b'<p>\xff</p><button _="on click toggle .a">A</button>')
+            usage = scanner.scan_file(template)
+            assert usage.commands == {"toggle"}
+
+    @pytest.mark.parametrize(
+        "tag", ['{%hs_attr "on click toggle .a"%}', '{%\ths_attr "on click toggle .a" %}']
+    )
+    def test_scan_file_django_tag_prefilter(self, tag: str):
+        """The raw-bytes pre-filter should let {% hs... %} tags through."""
+        scanner = Scanner()
+        with TemporaryDirectory() as tmpdir:
+            template = Path(tmpdir) / "test.html"
+            template.write_text(f'{{% extends "base.html" %}}<b {tag}>B</b>')
+            usage = scanner.scan_file(template)
+            assert usage.commands == {"toggle"}
+
+    def test_scan_file_upper_case_script_type(self):
+        """scan_file should not reject an upper-case MIME type."""
+        scanner = Scanner()
+        with TemporaryDirectory() as tmpdir:
+            template = Path(tmpdir) / "test.html"
+            template.write_text(
+                '<script type="Text/HyperScript">on click toggle .a</script>'
+            )
+            usage = scanner.scan_file(template)
+            assert usage.commands == {"toggle"}
+
     def test_scan_file_nonexistent(self):
         """scan_file on nonexistent file returns empty usage."""
         scanner = Scanner()
@@ -462,6 +665,236 @@ class TestScanDirectory:
             # Only the non-excluded file should be found
             assert "toggle" in list(results.values())[0].commands
 
+    def test_scan_directory_does_not_descend_into_excluded(self, monkeypatch):
+        """Excluded directories should be pruned from the walk entirely."""
+        scanner = Scanner()
+        seen: list[Path] = []
+        original = scanner.should_scan
+        monkeypatch.setattr(
+            scanner, "should_scan", lambda path: seen.append(path) or original(path)
+        )
+        with TemporaryDirectory() as tmpdir:
+            nested = Path(tmpdir) / "node_modules" / "pkg" / "templates"
+            nested.mkdir(parents=True)
+            (nested / "page.html").write_text('<b _="on click add .x">B</b>')
+            (Path(tmpdir) / "page.html").write_text('<b _="on click hide me">B</b>')
+
+            results = scanner.scan_directory(Path(tmpdir))
+            assert len(results) == 1
+            assert all("node_modules" not in str(path) for path in seen)
+
+
+class UppercaseCommandsScanner(Scanner):
+    """Scanner subclass used to check that worker processes honour overrides."""
+
+    def analyze_script(self, script: str) -> FileUsage:
+        usage = super().analyze_script(script)
+        usage.commands = {command.upper() for command in usage.commands}
+        return usage
+
+
+class TestScanDirectoryParallel:
+    """Tests for scanning directories with a process pool."""
+
+    def _write_templates(self, root: Path, count: int) -> None:
+        for i in range(count):
+            (root / f"page{i}.html").write_text(
+                f'<button _="on click toggle .item{i}">Click</button>'
+            )
+        (root / "plain.html").write_text("<p>No hyperscript</p>")
+
+    def test_parallel_matches_serial(self):
+        """Parallel scan should produce the same results as scan_directory."""
+        scanner = Scanner()
+        with TemporaryDirectory() as tmpdir:
+            self._write_templates(Path(tmpdir), PARALLEL_MIN_FILES)
+            (Path(tmpdir) / "last.html").write_text('<b _="on click add .x">B</b>')
+
+            results = scanner.scan_directory_parallel(Path(tmpdir), workers=2)
+            assert results == scanner.scan_directory(Path(tmpdir))
+            assert len(results) == PARALLEL_MIN_FILES + 1
+
+    def test_parallel_uses_scanner_subclass(self):
+        """Worker processes should scan with the caller's Scanner subclass."""
+        scanner = UppercaseCommandsScanner()
+        with TemporaryDirectory() as tmpdir:
+            self._write_templates(Path(tmpdir), PARALLEL_MIN_FILES)
+
+            results = scanner.scan_directory_parallel(Path(tmpdir), workers=2)
+            assert results == scanner.scan_directory(Path(tmpdir))
+            assert {c for usage in results.values() for c in usage.commands} == {"TOGGLE"}
+
+    def test_small_directory_scans_serially(self):
+        """Below the threshold, scanning should not need a process pool."""
+        scanner = Scanner()
+        with TemporaryDirectory() as tmpdir:
+            self._write_templates(Path(tmpdir), 3)
+            results = scanner.scan_directory_parallel(Path(tmpdir))
+            assert len(results) == 3
+
+    def test_parallel_nonexistent(self):
+        """Parallel scan of a nonexistent dir returns empty."""
+        scanner = Scanner()
+        assert scanner.scan_directory_parallel(Path("/nonexistent/dir")) == {}
+
+
+class TestScanCache:
+    """Tests for the mtime/size scan cache."""
+
+    def test_unchanged_file_served_from_cache(self):
+        """A file with the same mtime and size should not be re-read."""
+        with TemporaryDirectory() as tmpdir:
+            template = Path(tmpdir) / "page.html"
+            template.write_text('<b _="on click hide me">B</b>')
+            scanner = Scanner(cache_path=Path(tmpdir) / "cache.json")
+            assert scanner.scan_file(template).commands == {"hide"}
+
+            # Same size, same mtime: the cached result must be returned
+            stat = template.stat()
+            template.write_text('<b _="on click show me">B</b>')
+            os.utime(template, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            assert scanner.scan_file(template).commands == {"hide"}
+
+    def test_modified_file_is_rescanned(self):
+        """A file whose size or mtime changed should be scanned again."""
+        with TemporaryDirectory() as tmpdir:
+            template = Path(tmpdir) / "page.html"
+            template.write_text('<b _="on click hide me">B</b>')
+            scanner = Scanner(cache_path=Path(tmpdir) / "cache.json")
+            scanner.scan_file(template)
+
+            template.write_text('<b _="on click toggle .open">B</b>')
+            assert scanner.scan_file(template).commands == {"toggle"}
+
+    def test_cache_persists_between_scanners(self):
+        """scan_directory should save the cache for the next Scanner."""
+        with TemporaryDirectory() as tmpdir:
+            templates = Path(tmpdir) / "templates"
+            templates.mkdir()
+            (templates / "page.html").write_text('<b _="on click hide me">B</b>')
+            cache_path = Path(tmpdir) / "cache.json"
+
+            first = Scanner(cache_path=cache_path).scan_directory(templates)
+            assert cache_path.exists()
+
+            scanner = Scanner(cache_path=cache_path)
+            scanner.scan_content = None  # any re-scan would fail
+            assert scanner.scan_directory(templates) == first
+
+    def test_corrupt_cache_is_ignored(self):
+        """An unreadable cache file should be treated as empty."""
+        with TemporaryDirectory() as tmpdir:
+            cache_path = Path(tmpdir) / "cache.json"
+            cache_path.write_text("{not json")
+            template = Path(tmpdir) / "page.html"
+            template.write_text('<b _="on click hide me">B</b>')
+
+            scanner = Scanner(cache_path=cache_path)
+            assert scanner.scan_file(template).commands == {"hide"}
+
+    def test_cache_version_tracks_keyword_tables(self, monkeypatch):
+        """Changing the keyword tables should invalidate existing caches."""
+        version = scanner_module._cache_version()
+        assert version == scanner_module._CACHE_VERSION
+        monkeypatch.setattr(
+            scanner_module, "VALID_COMMANDS", scanner_module.VALID_COMMANDS | {"swap"}
+        )
+        assert scanner_module._cache_version() != version
+
+    def test_cache_from_other_version_is_ignored(self, monkeypatch):
+        """A cache written with different keyword tables should be re-scanned."""
+        with TemporaryDirectory() as tmpdir:
+            cache_path = Path(tmpdir) / "cache.json"
+            template = Path(tmpdir) / "page.html"
+            template.write_text('<b _="on click hide me">B</b>')
+            monkeypatch.setattr(scanner_module, "_CACHE_VERSION", "old")
+            Scanner(cache_path=cache_path).scan_directory(Path(tmpdir))
+            assert json.loads(cache_path.read_text())["version"] == "old"
+            monkeypatch.undo()
+
+            assert Scanner(cache_path=cache_path)._cache == {}
+
+    def test_deleted_files_are_pruned(self):
+        """Entries for files that no longer exist should be dropped on save."""
+        with TemporaryDirectory() as tmpdir:
+            cache_path = Path(tmpdir) / "cache.json"
+            templates = Path(tmpdir) / "templates"
+            templates.mkdir()
+            (templates / "keep.html").write_text('<b _="on click hide me">B</b>')
+            gone = templates / "gone.html"
+            gone.write_text('<b _="on click show me">B</b>')
+
+            Scanner(cache_path=cache_path).scan_directory(templates)
+            gone.unlink()
+            Scanner(cache_path=cache_path).scan_directory(templates)
+
+            files = json.loads(cache_path.read_text())["files"]
+            assert list(files) == [str(templates / "keep.html")]
+
+    def test_scanning_directories_one_at_a_time_keeps_entries(self):
+        """Scanning B after A should not prune A's cache entries."""
+        with TemporaryDirectory() as tmpdir:
+            cache_path = Path(tmpdir) / "cache.json"
+            directories = [Path(tmpdir) / "a", Path(tmpdir) / "b"]
+            for directory in directories:
+                directory.mkdir()
+                (directory / "p.html").write_text('<b _="on click hide me">B</b>')
+
+            scanner = Scanner(cache_path=cache_path)
+            for directory in directories:
+                scanner.scan_directory(directory)
+
+            files = json.loads(cache_path.read_text())["files"]
+            assert sorted(files) == [str(directory / "p.html") for directory in directories]
+
+    def test_scan_directories_saves_once(self, monkeypatch):
+        """scan_directories should write the cache once, keeping every directory."""
+        with TemporaryDirectory() as tmpdir:
+            cache_path = Path(tmpdir) / "cache.json"
+            directories = [Path(tmpdir) / "a", Path(tmpdir) / "b"]
+            for directory in directories:
+                directory.mkdir()
+                (directory / "page.html").write_text('<b _="on click hide me">B</b>')
+
+            scanner = Scanner(cache_path=cache_path)
+            writes = []
+            write_text = Path.write_text
+
+            def counting_write_text(path, *args, **kwargs):
+                writes.append(path)
+                return write_text(path, *args, **kwargs)
+
+            monkeypatch.setattr(Path, "write_text", counting_write_text)
+            scanner.scan_directories(directories)
+
+            assert len(writes) == 1
+            assert len(json.loads(cache_path.read_text())["files"]) == 2
+
+    @pytest.mark.parametrize(
+        "files",
+        [
+            [],
+            {"PAGE": None},
+            {"PAGE": {"mtime_ns": "MTIME", "size": "SIZE"}},
+            {"PAGE": {"mtime_ns": "MTIME", "size": "SIZE", "usage": []}},
+            {"PAGE": {"mtime_ns": "MTIME", "size": "SIZE", "usage": {"commands": 1}}},
+        ],
+    )
+    def test_malformed_cache_entries_are_rescanned(self, files):
+        """Valid JSON with the wrong structure should be treated as a miss."""
+        with TemporaryDirectory() as tmpdir:
+            cache_path = Path(tmpdir) / "cache.json"
+            template = Path(tmpdir) / "page.html"
+            template.write_text('<b _="on click hide me">B</b>')
+            stat = template.stat()
+            data = json.dumps({"version": scanner_module._CACHE_VERSION, "files": files})
+            data = data.replace('"PAGE"', json.dumps(str(template)))
+            data = data.replace('"MTIME"', str(stat.st_mtime_ns))
+            cache_path.write_text(data.replace('"SIZE"', str(stat.st_size)))
+
+            scanner = Scanner(cache_path=cache_path)
+            assert scanner.scan_file(template).commands == {"hide"}
+
 
 class TestPatterns:
     """Tests for regex patterns."""
@@ -518,6 +951,18 @@ class TestPatterns:
         pattern = BLOCK_PATTERNS[block]
         assert pattern.search(script) is not None
 
+    @pytest.mark.parametrize(
+        "block,script,group",
+        [
+            ("repeat", "repeat 3 times", "3"),
+            ("repeat", "repeat :count times", ":count"),
+            ("for", "for every x in .list", "every"),
+        ],
+    )
+    def test_block_pattern_groups(self, block: str, script: str, group: str):
+        """Test repeat/for patterns capture the count and each/every."""
+        assert BLOCK_PATTERNS[block].search(script).group(1) == group
+
     @pytest.mark.parametrize(
         "expr", ["first", "last", "next", "previous", "closest", "parent"]
     )
@@ -526,6 +971,78 @@ class TestPatterns:
         text = f"{expr} in .items"
         assert POSITIONAL_PATTERN.search(text) is not None
 
+    @pytest.mark.parametrize(
+        "script",
+        [
+            "on click removeClass .a then log it",
+            "REPEAT 2 TIMES show me",
+            "for each x in first .items put x into me",
+            "unless x matches .b fetch /a",
+            "on click go to url /",
+        ],
+    )
+    def test_patterns_agree_with_analyze_script(self, script: str):
+        """The public patterns should detect what analyze_script detects."""
+        usage = Scanner().analyze_script(script)
+        commands = {m.group(1).lower() for m in COMMAND_PATTERN.finditer(script)}
+        blocks = {
+            "if" if block == "unless" else block
+            for block, pattern in BLOCK_PATTERNS.items()
+            if pattern.search(script)
+        }
+        assert commands == usage.commands
+        assert blocks == usage.blocks
+        assert (POSITIONAL_PATTERN.search(script) is not None) == usage.positional
+
+
+class TestRegexBackend:
+    """Tests for the optional google-re2 extraction backend."""
+
+    def test_re2_extracts_all_formats(self, monkeypatch):
+        """The combined pattern should extract every format when run on re2."""
+        re2 = pytest.importorskip("re2")
+        pattern = re2.compile(scanner_module.HYPERSCRIPT_PATTERN.pattern)
+        monkeypatch.setattr(scanner_module, "HYPERSCRIPT_PATTERN", pattern)
+        scanner = Scanner()
+        content = """
+            <a _="on click hide me">A</a>
+            <a _='on click show me'>B</a>
+            <a _=`on click log 1`>C</a>
+            <a _={`on click log 2`}>D</a>
+            <a _={"on click log 3"}>E</a>
+            <a data-hs="on click log 4">F</a>
+            <a data-hs='on click log 5'>G</a>
+            <a {% hs %}
+                on load add .x
+            {% endhs %}>H</a>
+            <a {% hs_attr "on click log 6" %}>I</a>
+            <a {% hs_attr 'on click log 7' %}>J</a>
+            {% hs_script "behavior A end" %}
+            {% hs_script 'behavior B end' %}
+            <script type="text/hyperscript">def f() log 8 end</script>
+        """
+        assert scanner.extract_hyperscript(content) == [
+            "on click hide me",
+            "on click show me",
+            "on click log 1",
+            "on click log 2",
+            "on click log 3",
+            "on click log 4",
+            "on click log 5",
+            "on load add .x",
+            "on click log 6",
+            "on click log 7",
+            "behavior A end",
+            "behavior B end",
+            "def f() log 8 end",
+        ]
+
+    def test_backend_extracts_all_formats(self):
+        """Whichever backend is active must support the combined pattern."""
+        scanner = Scanner()
+        content = '<a _="on click hide me">A</a>{% hs %}\non load show me\n{% endhs %}'
+        assert scanner.extract_hyperscript(content) == ["on click hide me", "on load show me"]
+
 
 class TestJSXPatterns:
     """Tests for JSX-specific extraction patterns."""